@@ -0,0 +1,109 @@
+import argparse
+import math
+import sys
+import os
+import time
+
+# Add src to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from config import SERVICE_HOST, SERVICE_PORT, SERVICE_SOCKET, SERVICE_WORKERS, MAX_WORKERS
+from utils.logger import setup_logger
+
+def _print_job(job):
+    print(f"{job['id']}  {job['state']:<9}  {job['progress']:5.1f}%  {job['stage']}  {job['input_path']}")
+    if job.get('preflight') and job['state'] in ('queued', 'running'):
+        remaining = job['preflight']['eta_seconds'] * (1 - job['progress'] / 100)
+        print(f"    ~{remaining:.0f}s remaining (estimated)")
+    if job.get('error'):
+        print(f"    error: {job['error']}")
+
+def main():
+    """Local translation service entry point"""
+    parser = argparse.ArgumentParser(description="Local PDF translation job service")
+    parser.add_argument('--host', default=SERVICE_HOST)
+    parser.add_argument('--port', type=int, default=SERVICE_PORT)
+    parser.add_argument('--socket', dest='socket_path', default=SERVICE_SOCKET,
+                        help="Unix socket path (used instead of host/port)")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    serve_parser = subparsers.add_parser('serve', help="Run the service")
+    serve_parser.add_argument('--workers', type=int, default=SERVICE_WORKERS,
+                              help="Number of jobs processed concurrently")
+
+    submit_parser = subparsers.add_parser('submit', help="Submit a PDF for translation")
+    submit_parser.add_argument('input_path')
+    submit_parser.add_argument('--format', dest='output_format', choices=['pdf', 'docx'], default='pdf')
+    submit_parser.add_argument('--output', dest='output_path')
+    submit_parser.add_argument('--priority', type=int, default=0,
+                               help="Lower values run first")
+    submit_parser.add_argument('--wait', action='store_true', help="Wait for the job to finish")
+
+    status_parser = subparsers.add_parser('status', help="Show job status")
+    status_parser.add_argument('job_id', nargs='?')
+
+    cancel_parser = subparsers.add_parser('cancel', help="Cancel a queued job")
+    cancel_parser.add_argument('job_id')
+
+    preflight_parser = subparsers.add_parser('preflight', help="Estimate volume and duration of a PDF")
+    preflight_parser.add_argument('input_paths', nargs='+')
+
+    args = parser.parse_args()
+
+    if args.command == 'serve':
+        os.makedirs('logs', exist_ok=True)
+        logger = setup_logger()
+        logger.info("Starting translation service")
+
+        from service.server import run_service
+        run_service(args.host, args.port, args.workers, args.socket_path)
+        return
+
+    if args.command == 'preflight':
+        from core.preflight import PDFPreflight, format_preflight
+        from utils.validators import validate_pdf_file
+        etas = []
+        for input_path in args.input_paths:
+            try:
+                validate_pdf_file(input_path)
+                report = PDFPreflight(input_path).analyze()
+            except Exception as e:
+                print(f"{input_path}\nError: {e}\n")
+                continue
+            print(f"{input_path}\n{format_preflight(report)}\n")
+            if report['text_pages']:
+                etas.append(report['eta_seconds'])
+        # Each worker translates one whole document, so wall time can never drop
+        # below the longest document; more workers than that only sit idle
+        longest = max(etas, default=0)
+        recommended_workers = max(1, min(MAX_WORKERS, math.ceil(sum(etas) / longest))) if longest else 1
+        wall_time = max(longest, sum(etas) / recommended_workers)
+        print(f"{len(etas)} document(s) to translate: ~{wall_time / 60:.1f} min "
+              f"with recommended --workers {recommended_workers}")
+        return
+
+    from service.client import ServiceClient, ServiceError
+    client = ServiceClient(args.host, args.port, socket_path=args.socket_path)
+
+    try:
+        if args.command == 'submit':
+            job = client.submit(args.input_path, args.output_format, args.output_path, args.priority)
+            _print_job(job)
+            while args.wait and job['state'] in ('queued', 'running'):
+                time.sleep(1)
+                job = client.get_job(job['id'])
+                _print_job(job)
+        elif args.command == 'status':
+            jobs = [client.get_job(args.job_id)] if args.job_id else client.list_jobs()
+            for job in jobs:
+                _print_job(job)
+        elif args.command == 'cancel':
+            _print_job(client.cancel(args.job_id))
+    except ServiceError as e:
+        sys.exit(f"Error: {e}")
+    except OSError as e:
+        address = f"unix:{args.socket_path}" if args.socket_path else f"{args.host}:{args.port}"
+        sys.exit(f"Could not reach translation service at {address}: {e}")
+
+if __name__ == "__main__":
+    main()
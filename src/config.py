@@ -14,11 +14,34 @@ TARGET_LANG = 'ar'
 MAX_PDF_SIZE_MB = 50
 SUPPORTED_FORMATS = ['.pdf']
 
+# Translation throughput / preflight estimates
+CHUNK_SIZE = 4500  # Characters per translator request
+PREFLIGHT_SAMPLE_PAGES = 20  # Pages sampled for character volume
+DEFAULT_CHARS_PER_SECOND = 1500  # Used until real throughput is measured
+THROUGHPUT_HISTORY = 20  # Recent jobs averaged for ETA
+THROUGHPUT_FILE = os.path.join(TEMP_DIR, 'throughput.json')
+
+# PDF output
+PDF_PAGE_COMPRESSION = True  # ReportLab's default; set False to write uncompressed page streams (debugging)
+
 # Performance settings
 BATCH_SIZE = 100  # Process text in batches
 MAX_WORKERS = 4   # Parallel processing workers
 
+# Logging
+LOG_LEVEL = 'INFO'       # 'DEBUG' also logs per-chunk translation details
+LOG_FORMAT = 'text'      # 'text' or 'json' (JSON lines log file)
+LOG_PAGE_INTERVAL = 50   # Per-page progress is logged every N pages
+
 # GUI settings
 WINDOW_TITLE = "PDF English to Arabic Translator"
 WINDOW_SIZE = "800x600"
 THEME_COLOR = "#2c3e50"
+
+# Local job service
+SERVICE_HOST = '127.0.0.1'
+SERVICE_PORT = 8765
+SERVICE_SOCKET = None  # Unix socket path; used instead of host/port when set
+SERVICE_TOKEN_FILE = os.path.join(TEMP_DIR, 'service.token')  # Owner-only access token
+SERVICE_WORKERS = 2  # Concurrent jobs sharing the warm translator
+SERVICE_JOB_RETENTION = 200  # Finished jobs kept for status queries
@@ -1,6 +1,6 @@
 import pdfplumber
 from PyPDF2 import PdfReader
-from utils.logger import setup_logger
+from utils.logger import setup_logger, should_log_page
 
 logger = setup_logger(__name__)
 
@@ -19,6 +19,7 @@ class PDFExtractor:
             with pdfplumber.open(self.pdf_path) as pdf:
                 total_pages = len(pdf.pages)
                 logger.info(f"Total pages: {total_pages}")
+                empty_pages = []
                 
                 for page_num, page in enumerate(pdf.pages, 1):
                     # Extract text with left-to-right direction for English
@@ -29,9 +30,17 @@ class PDFExtractor:
                             'page': page_num,
                             'text': text.strip()
                         })
-                        logger.debug(f"Extracted page {page_num}/{total_pages}")
+                        if should_log_page(page_num, total_pages):
+                            logger.debug("Extracted page %d/%d", page_num, total_pages)
                     else:
-                        logger.warning(f"No text found on page {page_num}")
+                        empty_pages.append(page_num)
+                
+                # One summary instead of a warning per page (scans can have thousands)
+                if empty_pages:
+                    shown = ', '.join(str(p) for p in empty_pages[:10])
+                    if len(empty_pages) > 10:
+                        shown += ', ...'
+                    logger.warning(f"No text found on {len(empty_pages)} page(s): {shown}")
                 
                 logger.info(f"Successfully extracted text from {len(self.text_content)} pages")
                 return self.text_content
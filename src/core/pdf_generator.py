@@ -5,25 +5,27 @@ from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 import arabic_reshaper
 from bidi.algorithm import get_display
+from config import PDF_PAGE_COMPRESSION
 from utils.logger import setup_logger
 import os
+import threading
 
 logger = setup_logger(__name__)
 
-class ArabicPDFGenerator:
-    """Generate PDF with proper Arabic text rendering"""
+ARABIC_FONT_NAME = "Amiri"
+
+_font_lock = threading.Lock()
+
+def register_arabic_font(font_name=ARABIC_FONT_NAME):
+    """Register Arabic font from local file or Windows fonts
     
-    def __init__(self, output_path):
-        self.output_path = output_path
-        self.page_width, self.page_height = A4
-        self.margin = 50
-        self.line_height = 20
-        self.font_size = 12
-        self.font_name = "Amiri"
-        self._setup_arabic_font()
+    Registration is process-wide, so a long-running service calls this once
+    at start-up and later generators reuse the loaded TTF.
+    """
+    with _font_lock:
+        if font_name in pdfmetrics.getRegisteredFontNames():
+            return
         
-    def _setup_arabic_font(self):
-        """Register Arabic font from local file or Windows fonts"""
         try:
             # Try project fonts folder first
             project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
@@ -32,7 +34,7 @@ class ArabicPDFGenerator:
             
             if os.path.exists(font_path):
                 logger.info(f"Using Arabic font from: {font_path}")
-                pdfmetrics.registerFont(TTFont(self.font_name, font_path))
+                pdfmetrics.registerFont(TTFont(font_name, font_path))
                 logger.info("Arabic font registered successfully")
                 return
             
@@ -47,7 +49,7 @@ class ArabicPDFGenerator:
             for win_font in windows_fonts:
                 if os.path.exists(win_font):
                     logger.info(f"Using Windows font: {win_font}")
-                    pdfmetrics.registerFont(TTFont(self.font_name, win_font))
+                    pdfmetrics.registerFont(TTFont(font_name, win_font))
                     logger.info("Windows Arabic font registered successfully")
                     return
             
@@ -56,7 +58,25 @@ class ArabicPDFGenerator:
         except Exception as e:
             logger.error(f"Failed to setup Arabic font: {str(e)}")
             raise
+
+class ArabicPDFGenerator:
+    """Generate PDF with proper Arabic text rendering
+    
+    ReportLab embeds TrueType fonts as subsets of the glyphs actually drawn;
+    the subset font objects are written once and shared by every page.
+    """
     
+    def __init__(self, output_path, compress=PDF_PAGE_COMPRESSION):
+        self.output_path = output_path
+        self.compress = compress
+        self.pages_written = 0
+        self.page_width, self.page_height = A4
+        self.margin = 50
+        self.line_height = 20
+        self.font_size = 12
+        self.font_name = ARABIC_FONT_NAME
+        register_arabic_font(self.font_name)
+        
     def _prepare_arabic_text(self, text):
         """Reshape and reorder Arabic text for proper RTL display"""
         reshaped_text = arabic_reshaper.reshape(text)
@@ -64,11 +84,19 @@ class ArabicPDFGenerator:
         return bidi_text
     
     def generate_pdf(self, translated_pages, progress_callback=None):
-        """Generate PDF with Arabic text"""
+        """Generate PDF with Arabic text and return output size statistics"""
         logger.info(f"Generating Arabic PDF: {self.output_path}")
         
         try:
-            c = canvas.Canvas(self.output_path, pagesize=A4)
+            # Starting pages in the Arabic font avoids an unused Helvetica resource
+            c = canvas.Canvas(
+                self.output_path,
+                pagesize=A4,
+                pageCompression=1 if self.compress else 0,
+                initialFontName=self.font_name,
+                initialFontSize=self.font_size
+            )
+            self.pages_written = 0
             total_pages = len(translated_pages)
             
             for i, page_data in enumerate(translated_pages):
@@ -80,10 +108,31 @@ class ArabicPDFGenerator:
             c.save()
             logger.info(f"PDF generated successfully: {self.output_path}")
             
+            stats = self._output_stats()
+            logger.info(
+                f"Output size: {stats['bytes']} bytes, {stats['pages']} pages, "
+                f"{stats['bytes_per_page']:.0f} bytes/page"
+            )
+            return stats
+            
         except Exception as e:
             logger.error(f"PDF generation failed: {str(e)}")
             raise
     
+    def _output_stats(self):
+        """Output file size and bytes per written page"""
+        size = os.path.getsize(self.output_path)
+        return {
+            'bytes': size,
+            'pages': self.pages_written,
+            'bytes_per_page': size / self.pages_written if self.pages_written else 0,
+        }
+    
+    def _show_page(self, canvas_obj):
+        """Finish the current page and count it"""
+        canvas_obj.showPage()
+        self.pages_written += 1
+    
     def _add_page(self, canvas_obj, text, page_number):
         """Add a single page with selectable Arabic text"""
         canvas_obj.setFont(self.font_name, self.font_size)
@@ -120,7 +169,7 @@ class ArabicPDFGenerator:
                     if current_line:
                         # Draw the line
                         if y < self.margin + 50:
-                            canvas_obj.showPage()
+                            self._show_page(canvas_obj)
                             canvas_obj.setFont(self.font_name, self.font_size)
                             y = self.page_height - self.margin
                         
@@ -131,7 +180,7 @@ class ArabicPDFGenerator:
             # Draw remaining words
             if current_line:
                 if y < self.margin + 50:
-                    canvas_obj.showPage()
+                    self._show_page(canvas_obj)
                     canvas_obj.setFont(self.font_name, self.font_size)
                     y = self.page_height - self.margin
                 
@@ -142,4 +191,4 @@ class ArabicPDFGenerator:
         canvas_obj.setFont(self.font_name, 10)
         canvas_obj.drawCentredString(self.page_width / 2, 30, f"صفحة {page_number}")
         
-        canvas_obj.showPage()
+        self._show_page(canvas_obj)
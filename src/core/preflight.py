@@ -0,0 +1,161 @@
+import math
+import re
+import time
+import pdfplumber
+from PyPDF2 import PdfReader
+from PyPDF2.generic import ArrayObject
+from config import CHUNK_SIZE, PREFLIGHT_SAMPLE_PAGES
+from utils.throughput import get_chars_per_second
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Text-showing operator (Tj, TJ, ', ") following its string or array operand
+TEXT_SHOW_PATTERN = re.compile(rb'[)>\]]\s*(?:Tj|TJ|\'|")')
+
+# Nesting limit for Form XObjects (guards against self-referencing forms)
+MAX_FORM_DEPTH = 4
+
+class PDFPreflight:
+    """Quickly estimate translation volume and duration
+    
+    Pages are classified from their raw content streams; layout extraction
+    runs only on a small sample, using the same pdfplumber extraction as
+    PDFExtractor so character counts match the measured throughput.
+    """
+
+    def __init__(self, pdf_path, sample_pages=PREFLIGHT_SAMPLE_PAGES):
+        self.pdf_path = pdf_path
+        self.sample_pages = sample_pages
+
+    def _page_has_text(self, page):
+        """Check for text objects in the page content without decoding glyphs"""
+        resources = page.get('/Resources')
+        if resources is None:
+            return False
+
+        return self._content_has_text(resources.get_object(), self._content_data(page))
+
+    def _content_data(self, page):
+        """Raw page content, joining pages split over several streams"""
+        contents = page.get_contents()
+        if contents is None:
+            return b''
+        contents = contents.get_object()
+        if isinstance(contents, ArrayObject):
+            return b'\n'.join(stream.get_object().get_data() for stream in contents)
+        return contents.get_data()
+
+    def _content_has_text(self, resources, data, depth=0):
+        """Check a content stream and the Form XObjects it uses for shown text"""
+        if resources.get('/Font') and TEXT_SHOW_PATTERN.search(data):
+            return True
+
+        # Scanners often wrap the page image in a form, so look inside forms
+        xobjects = resources.get('/XObject')
+        if not xobjects or depth >= MAX_FORM_DEPTH:
+            return False
+
+        for xobject in xobjects.get_object().values():
+            xobject = xobject.get_object()
+            if xobject.get('/Subtype') != '/Form':
+                continue
+            # Forms without their own resources use the parent's
+            form_resources = xobject.get('/Resources')
+            form_resources = form_resources.get_object() if form_resources is not None else resources
+            if self._content_has_text(form_resources, xobject.get_data(), depth + 1):
+                return True
+        return False
+
+    def _sample_indices(self, indices):
+        """Evenly spaced subset of page indices"""
+        if len(indices) <= self.sample_pages:
+            return indices
+        step = len(indices) / self.sample_pages
+        return [indices[int(i * step)] for i in range(self.sample_pages)]
+
+    def analyze(self):
+        """Scan the PDF and return a job estimate"""
+        logger.info(f"Preflight analysis: {self.pdf_path}")
+        start_time = time.perf_counter()
+
+        try:
+            reader = PdfReader(self.pdf_path)
+            total_pages = len(reader.pages)
+
+            text_indices = []
+            image_only_pages = []
+            for index, page in enumerate(reader.pages):
+                try:
+                    has_text = self._page_has_text(page)
+                except Exception as e:
+                    # Malformed page: keep it as a text page rather than abort the scan
+                    logger.debug("Could not inspect page %d: %s", index + 1, e)
+                    has_text = True
+
+                if has_text:
+                    text_indices.append(index)
+                else:
+                    image_only_pages.append(index + 1)
+
+            # Extract only a sample of text pages and extrapolate
+            sampled = self._sample_indices(text_indices)
+            sample_chars = 0
+            sample_requests = 0
+            with pdfplumber.open(self.pdf_path) as pdf:
+                for index in sampled:
+                    try:
+                        text = (pdf.pages[index].extract_text() or '').strip()
+                    except Exception as e:
+                        logger.debug("Could not extract sample page %d: %s", index + 1, e)
+                        text = ''
+                    sample_chars += len(text)
+                    if text:
+                        sample_requests += math.ceil(len(text) / CHUNK_SIZE)
+
+            if sampled:
+                scale = len(text_indices) / len(sampled)
+                estimated_chars = int(sample_chars * scale)
+                expected_requests = math.ceil(sample_requests * scale)
+            else:
+                estimated_chars = 0
+                expected_requests = 0
+
+            chars_per_second = get_chars_per_second()
+            report = {
+                'pages': total_pages,
+                'text_pages': len(text_indices),
+                'image_only_pages': image_only_pages,
+                'sampled_pages': len(sampled),
+                'estimated_chars': estimated_chars,
+                'expected_requests': expected_requests,
+                'chars_per_second': round(chars_per_second, 1),
+                'eta_seconds': round(estimated_chars / chars_per_second, 1),
+                'analysis_seconds': round(time.perf_counter() - start_time, 3),
+            }
+
+            logger.info(
+                f"Preflight: {total_pages} pages, {len(image_only_pages)} image-only, "
+                f"~{estimated_chars} chars, ~{expected_requests} requests, "
+                f"ETA {report['eta_seconds']:.0f}s"
+            )
+            return report
+
+        except Exception as e:
+            logger.error(f"Preflight analysis failed: {str(e)}")
+            raise
+
+def format_preflight(report):
+    """Human-readable preflight summary"""
+    lines = [
+        f"Pages: {report['pages']} ({report['text_pages']} with text)",
+        f"Estimated characters: ~{report['estimated_chars']:,}",
+        f"Expected translator requests: ~{report['expected_requests']}",
+        f"Estimated time: ~{report['eta_seconds'] / 60:.1f} min at {report['chars_per_second']:.0f} chars/s",
+    ]
+    if report['image_only_pages']:
+        pages = ', '.join(str(p) for p in report['image_only_pages'][:10])
+        if len(report['image_only_pages']) > 10:
+            pages += ', ...'
+        lines.append(f"Image-only pages (no text): {len(report['image_only_pages'])} [{pages}]")
+    return '\n'.join(lines)
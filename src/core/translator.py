@@ -1,5 +1,7 @@
 from googletrans import Translator
-from utils.logger import setup_logger
+from config import CHUNK_SIZE
+from utils.logger import setup_logger, should_log_page
+from utils.throughput import record_throughput
 import time
 
 logger = setup_logger(__name__)
@@ -16,7 +18,7 @@ class OfflineTranslator:
         if not text or not text.strip():
             return ""
         
-        logger.info(f"Translating text of length: {len(text)}")
+        logger.debug("Translating text of length: %d", len(text))
         
         try:
             # Split into chunks (Google Translate has 5000 char limit per request)
@@ -27,7 +29,7 @@ class OfflineTranslator:
             
             for line in lines:
                 line_length = len(line)
-                if current_length + line_length > 4500 and current_chunk:
+                if current_length + line_length > CHUNK_SIZE and current_chunk:
                     chunks.append('\n'.join(current_chunk))
                     current_chunk = [line]
                     current_length = line_length
@@ -55,7 +57,7 @@ class OfflineTranslator:
                 time.sleep(0.1)  # Small delay to avoid rate limiting
             
             final_result = '\n'.join(translated_chunks)
-            logger.info("Translation completed successfully")
+            logger.debug("Translation completed successfully")
             return final_result
             
         except Exception as e:
@@ -67,10 +69,16 @@ class OfflineTranslator:
         translated_pages = []
         total_pages = len(pages_content)
         
+        logger.info(f"Translating {total_pages} pages")
+        start_time = time.perf_counter()
+        total_chars = 0
+        
         for i, page_data in enumerate(pages_content):
-            logger.info(f"Translating page {page_data['page']}/{total_pages}")
+            if should_log_page(i + 1, total_pages):
+                logger.info("Translating page %d/%d", page_data['page'], total_pages)
             
             translated_text = self.translate_text(page_data['text'])
+            total_chars += len(page_data['text'])
             translated_pages.append({
                 'page': page_data['page'],
                 'text': translated_text
@@ -79,4 +87,8 @@ class OfflineTranslator:
             if progress_callback:
                 progress_callback(i + 1, total_pages)
         
+        # Measured throughput feeds preflight ETA estimates
+        record_throughput(total_chars, time.perf_counter() - start_time)
+        
+        logger.info("Translation completed successfully")
         return translated_pages
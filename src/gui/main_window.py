@@ -1,12 +1,15 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import threading
+import time
 import os
 from config import WINDOW_TITLE, WINDOW_SIZE, THEME_COLOR
 from core.pdf_extractor import PDFExtractor
 from core.translator import OfflineTranslator
 from core.pdf_generator import ArabicPDFGenerator
 from core.word_generator import WordDocumentGenerator
+from core.preflight import PDFPreflight, format_preflight
+from service.client import ServiceClient, ServiceError
 from utils.validators import validate_pdf_file, validate_output_path, ValidationError
 from utils.logger import setup_logger
 
@@ -160,6 +163,19 @@ class PDFTranslatorApp:
     
     def _translate_pdf(self):
         """Perform PDF translation (runs in separate thread)"""
+        client = ServiceClient()
+        if client.is_available():
+            # The service runs its own preflight and reports it with the job
+            self._translate_via_service(client)
+            return
+        
+        self.status_text.set("Analyzing PDF...")
+        try:
+            report = PDFPreflight(self.input_file.get()).analyze()
+            self._log(format_preflight(report))
+        except Exception as e:
+            self._log(f"Preflight analysis skipped: {str(e)}")
+        
         try:
             self.status_text.set("Extracting text from PDF...")
             self._log("Starting PDF extraction...")
@@ -202,7 +218,8 @@ class PDFTranslatorApp:
                 self._log("Generating Arabic PDF...")
                 
                 generator = ArabicPDFGenerator(output_file)
-                generator.generate_pdf(translated_pages)
+                stats = generator.generate_pdf(translated_pages)
+                self._log(f"Output size: {stats['bytes'] / 1024:.1f} KB ({stats['bytes_per_page'] / 1024:.1f} KB/page)")
                 
             else:  # docx
                 output_file = f"{base_name}_arabic.docx"
@@ -233,6 +250,48 @@ class PDFTranslatorApp:
             # Re-enable button
             self.translate_btn.configure(state='normal')
     
+    def _translate_via_service(self, client):
+        """Submit translation to the local service and poll its progress"""
+        try:
+            self._log("Submitting job to local translation service...")
+            job = client.submit(self.input_file.get(), self.output_format.get())
+            self._log(f"Job {job['id']} queued")
+            
+            last_stage = None
+            preflight_shown = False
+            while job['state'] in ('queued', 'running'):
+                if job.get('preflight') and not preflight_shown:
+                    self._log(format_preflight(job['preflight']))
+                    preflight_shown = True
+                if job['stage'] != last_stage:
+                    self.status_text.set(f"{job['stage']}...")
+                    self._log(job['stage'])
+                    last_stage = job['stage']
+                self._update_progress(job['progress'], 100)
+                time.sleep(0.5)
+                job = client.get_job(job['id'])
+            
+            if job['state'] != 'completed':
+                raise ServiceError(job['error'] or f"Job {job['state']}")
+            
+            self._update_progress(100, 100)
+            self.status_text.set("Translation completed successfully!")
+            format_name = "PDF" if job['output_format'] == 'pdf' else "Word Document"
+            self._log(f"✓ Translation complete: {job['output_path']}")
+            messagebox.showinfo(
+                "Success", 
+                f"{format_name} created successfully!\n\nSaved to:\n{job['output_path']}"
+            )
+            
+        except (ServiceError, OSError) as e:
+            self.status_text.set("Translation failed")
+            self._log(f"✗ Error: {str(e)}")
+            logger.error(f"Service translation failed: {str(e)}")
+            messagebox.showerror("Translation Error", f"An error occurred:\n{str(e)}")
+        
+        finally:
+            self.translate_btn.configure(state='normal')
+    
     def run(self):
         """Start the application"""
         logger.info("Starting GUI application")
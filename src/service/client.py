@@ -0,0 +1,100 @@
+import http.client
+import json
+import os
+import socket
+from config import SERVICE_HOST, SERVICE_PORT, SERVICE_SOCKET, SERVICE_TOKEN_FILE
+
+
+class ServiceError(Exception):
+    """Error returned by the translation service"""
+    pass
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection over a Unix socket"""
+
+    def __init__(self, socket_path, timeout):
+        super().__init__('localhost', timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+class ServiceClient:
+    """Client for the local translation service"""
+
+    def __init__(self, host=SERVICE_HOST, port=SERVICE_PORT, timeout=5, socket_path=SERVICE_SOCKET,
+                 token_file=SERVICE_TOKEN_FILE):
+        self.host = host
+        self.port = port
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self.token_file = token_file
+
+    def _read_token(self):
+        # Re-read on each request: the service writes a new token when it restarts
+        try:
+            with open(self.token_file, encoding='utf-8') as f:
+                return f.read().strip()
+        except OSError:
+            return ''
+
+    def _connect(self):
+        if self.socket_path:
+            return UnixHTTPConnection(self.socket_path, self.timeout)
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def _request(self, method, path, payload=None):
+        data = json.dumps(payload).encode('utf-8') if payload is not None else None
+        connection = self._connect()
+        try:
+            connection.request(method, path, body=data, headers={
+                'Content-Type': 'application/json',
+                'X-Service-Token': self._read_token(),
+            })
+            response = connection.getresponse()
+            body = response.read()
+        except http.client.HTTPException as e:
+            raise ServiceError(str(e))
+        finally:
+            connection.close()
+
+        if response.status >= 400:
+            try:
+                message = json.loads(body).get('error', response.reason)
+            except ValueError:
+                message = f"{response.status} {response.reason}"
+            raise ServiceError(message)
+        return json.loads(body)
+
+    def is_available(self):
+        """Check whether a service is listening"""
+        try:
+            return self._request('GET', '/health').get('status') == 'ok'
+        except (OSError, ServiceError, ValueError):
+            return False
+
+    def submit(self, input_path, output_format='pdf', output_path=None, priority=0):
+        """Submit a job and return its status"""
+        # The service may run from another working directory
+        return self._request('POST', '/jobs', {
+            'input_path': os.path.abspath(input_path),
+            'output_format': output_format,
+            'output_path': os.path.abspath(output_path) if output_path else None,
+            'priority': priority,
+        })
+
+    def get_job(self, job_id):
+        """Return job status"""
+        return self._request('GET', f'/jobs/{job_id}')
+
+    def list_jobs(self):
+        """Return all jobs"""
+        return self._request('GET', '/jobs')['jobs']
+
+    def cancel(self, job_id):
+        """Cancel a queued job"""
+        return self._request('DELETE', f'/jobs/{job_id}')
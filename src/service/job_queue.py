@@ -0,0 +1,245 @@
+import itertools
+import os
+import queue
+import threading
+import time
+import uuid
+from config import SERVICE_WORKERS, SERVICE_JOB_RETENTION
+from core.pdf_extractor import PDFExtractor
+from core.translator import OfflineTranslator
+from core.pdf_generator import ArabicPDFGenerator, register_arabic_font
+from core.word_generator import WordDocumentGenerator
+from core.preflight import PDFPreflight
+from utils.validators import validate_pdf_file, validate_output_path, ValidationError
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Job states
+QUEUED = 'queued'
+RUNNING = 'running'
+COMPLETED = 'completed'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+
+OUTPUT_FORMATS = ('pdf', 'docx')
+
+
+class TranslationJob:
+    """A single document translation request and its progress"""
+
+    def __init__(self, input_path, output_format='pdf', output_path=None, priority=0):
+        if output_format not in OUTPUT_FORMATS:
+            raise ValidationError(f"Unsupported output format: {output_format}. Supported: {list(OUTPUT_FORMATS)}")
+
+        if not output_path:
+            base_name = os.path.splitext(input_path)[0]
+            output_path = f"{base_name}_arabic.{output_format}"
+        elif not output_path.lower().endswith(f".{output_format}"):
+            raise ValidationError(f"Output path must end in .{output_format}: {output_path}")
+
+        self.id = uuid.uuid4().hex[:12]
+        self.input_path = input_path
+        self.output_format = output_format
+        self.output_path = output_path
+        self.priority = priority
+        self.state = QUEUED
+        self.stage = 'Waiting in queue'
+        self.progress = 0.0
+        self.error = None
+        self.output_stats = None
+        self.preflight = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+
+    def to_dict(self):
+        """Serializable job status"""
+        return {
+            'id': self.id,
+            'input_path': self.input_path,
+            'output_format': self.output_format,
+            'output_path': self.output_path,
+            'priority': self.priority,
+            'state': self.state,
+            'stage': self.stage,
+            'progress': round(self.progress, 1),
+            'error': self.error,
+            'output_stats': self.output_stats,
+            'preflight': self.preflight,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+        }
+
+
+class TranslationService:
+    """Prioritized job queue running translations on one warm translator"""
+
+    def __init__(self, workers=SERVICE_WORKERS):
+        self.workers = max(1, workers)
+        self.jobs = {}
+        self._queue = queue.PriorityQueue()
+        self._counter = itertools.count()  # FIFO order within a priority
+        self._lock = threading.Lock()
+        self._threads = []
+        self._stopping = threading.Event()
+        self._preflight_queue = queue.Queue()
+        self.translator = None
+
+    def start(self):
+        """Warm up the translator and fonts and start worker threads"""
+        logger.info("Warming up translation backend")
+        self.translator = OfflineTranslator()
+        register_arabic_font()
+
+        for i in range(self.workers):
+            thread = threading.Thread(
+                target=self._worker, name=f"translation-worker-{i + 1}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+        # Preflight runs off the request path so submissions return immediately
+        self._preflight_thread = threading.Thread(
+            target=self._preflight_worker, name="preflight-worker", daemon=True
+        )
+        self._preflight_thread.start()
+
+        logger.info(f"Translation service started with {self.workers} worker(s)")
+
+    def stop(self):
+        """Stop workers after their current job"""
+        self._stopping.set()
+        for _ in self._threads:
+            self._queue.put((float('inf'), next(self._counter), None))
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        self._preflight_queue.put(None)
+        self._preflight_thread.join()
+        logger.info("Translation service stopped")
+
+    def submit(self, input_path, output_format='pdf', output_path=None, priority=0):
+        """Validate and enqueue a job. Lower priority values run first."""
+        validate_pdf_file(input_path)
+        job = TranslationJob(input_path, output_format, output_path, priority)
+        validate_output_path(job.output_path)
+
+        with self._lock:
+            self._prune_finished_jobs()
+            self.jobs[job.id] = job
+        self._queue.put((job.priority, next(self._counter), job))
+        self._preflight_queue.put(job)
+        logger.info(f"Queued job {job.id} (priority {job.priority}): {input_path}")
+        return job
+
+    def _prune_finished_jobs(self):
+        """Drop the oldest finished jobs beyond SERVICE_JOB_RETENTION (lock held)"""
+        finished = [job for job in self.jobs.values() if job.state in (COMPLETED, FAILED, CANCELLED)]
+        excess = len(finished) - SERVICE_JOB_RETENTION
+        if excess > 0:
+            finished.sort(key=lambda job: job.finished_at or job.created_at)
+            for job in finished[:excess]:
+                del self.jobs[job.id]
+
+    def queued_eta(self):
+        """Estimated seconds to drain queued and running jobs across all workers"""
+        with self._lock:
+            pending = [job for job in self.jobs.values() if job.state in (QUEUED, RUNNING)]
+
+        total = 0.0
+        for job in pending:
+            if job.preflight:
+                remaining = 1.0 - job.progress / 100.0
+                total += job.preflight['eta_seconds'] * remaining
+        return round(total / self.workers, 1)
+
+    def get_job(self, job_id):
+        """Return job by id or None"""
+        with self._lock:
+            return self.jobs.get(job_id)
+
+    def list_jobs(self):
+        """Return all jobs, newest first"""
+        with self._lock:
+            return sorted(self.jobs.values(), key=lambda job: job.created_at, reverse=True)
+
+    def cancel(self, job_id):
+        """Cancel a queued job. Running jobs cannot be cancelled."""
+        with self._lock:
+            job = self.jobs.get(job_id)
+            if job is None or job.state != QUEUED:
+                return False
+            job.state = CANCELLED
+            job.stage = 'Cancelled'
+            job.finished_at = time.time()
+        logger.info(f"Cancelled job {job_id}")
+        return True
+
+    def _preflight_worker(self):
+        """Estimate queued jobs in submission order"""
+        while True:
+            job = self._preflight_queue.get()
+            if job is None:
+                break
+            if job.state in (COMPLETED, FAILED, CANCELLED):
+                continue
+
+            try:
+                job.preflight = PDFPreflight(job.input_path).analyze()
+            except Exception as e:
+                logger.warning(f"Preflight failed for {job.input_path}: {str(e)}")
+
+    def _worker(self):
+        """Worker loop pulling jobs in priority order"""
+        while not self._stopping.is_set():
+            _, _, job = self._queue.get()
+            if job is None:
+                break
+
+            with self._lock:
+                if job.state != QUEUED:
+                    continue
+                job.state = RUNNING
+                job.started_at = time.time()
+
+            try:
+                self._run_job(job)
+                job.state = COMPLETED
+                job.stage = 'Completed'
+                job.progress = 100.0
+                logger.info(f"Job {job.id} completed: {job.output_path}")
+            except Exception as e:
+                job.state = FAILED
+                job.stage = 'Failed'
+                job.error = str(e)
+                logger.error(f"Job {job.id} failed: {str(e)}", exc_info=True)
+            finally:
+                job.finished_at = time.time()
+
+    def _run_job(self, job):
+        """Extract, translate and generate output for a job"""
+        job.stage = 'Extracting text from PDF'
+        extractor = PDFExtractor(job.input_path)
+        pages_content = extractor.extract_text()
+        job.progress = 10.0
+
+        job.stage = 'Translating to Arabic'
+
+        def translation_progress(current, total):
+            job.progress = 10.0 + 80.0 * current / total
+
+        translated_pages = self.translator.translate_pages(
+            pages_content,
+            progress_callback=translation_progress
+        )
+
+        if job.output_format == 'pdf':
+            job.stage = 'Generating Arabic PDF'
+            generator = ArabicPDFGenerator(job.output_path)
+            job.output_stats = generator.generate_pdf(translated_pages)
+        else:
+            job.stage = 'Generating Word Document'
+            generator = WordDocumentGenerator(job.output_path)
+            generator.generate_document(translated_pages)
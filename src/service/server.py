@@ -0,0 +1,213 @@
+import errno
+import hmac
+import json
+import os
+import secrets
+import socket
+import stat
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from socketserver import ThreadingMixIn, UnixStreamServer
+from config import SERVICE_HOST, SERVICE_PORT, SERVICE_SOCKET, SERVICE_TOKEN_FILE, SERVICE_WORKERS
+from service.job_queue import TranslationService
+from utils.validators import ValidationError
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class ServiceRequestHandler(BaseHTTPRequestHandler):
+    """JSON API for the local translation service
+
+    GET    /health      - service status
+    GET    /jobs        - list jobs
+    GET    /jobs/<id>   - job status and progress
+    POST   /jobs        - submit {input_path, output_format, output_path, priority}
+    DELETE /jobs/<id>   - cancel a queued job
+
+    Every request must send the token from SERVICE_TOKEN_FILE in the
+    X-Service-Token header, so only users who can read that file can use
+    the service. Requests carrying an Origin header are rejected so web
+    pages open in a browser cannot drive the service; POST bodies must be
+    application/json.
+    """
+
+    @property
+    def service(self):
+        return self.server.service
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _job_id(self):
+        parts = self.path.strip('/').split('/')
+        if len(parts) == 2 and parts[0] == 'jobs':
+            return parts[1]
+        return None
+
+    def _reject_request(self):
+        """Refuse cross-origin and unauthenticated requests"""
+        if self.headers.get('Origin') is not None:
+            self._send_json(403, {'error': 'Cross-origin requests are not allowed'})
+            return True
+
+        token = self.headers.get('X-Service-Token', '')
+        if not hmac.compare_digest(token.encode('utf-8'), self.server.token.encode('utf-8')):
+            self._send_json(401, {'error': 'Missing or invalid service token'})
+            return True
+        return False
+
+    def do_GET(self):
+        if self._reject_request():
+            return
+
+        if self.path == '/health':
+            self._send_json(200, {
+                'status': 'ok',
+                'workers': self.service.workers,
+                'queued_eta_seconds': self.service.queued_eta(),
+            })
+        elif self.path.rstrip('/') == '/jobs':
+            self._send_json(200, {'jobs': [job.to_dict() for job in self.service.list_jobs()]})
+        else:
+            job = self.service.get_job(self._job_id())
+            if job is None:
+                self._send_json(404, {'error': 'Job not found'})
+            else:
+                self._send_json(200, job.to_dict())
+
+    def do_POST(self):
+        if self._reject_request():
+            return
+
+        if self.path.rstrip('/') != '/jobs':
+            self._send_json(404, {'error': 'Not found'})
+            return
+
+        content_type = self.headers.get('Content-Type', '').split(';')[0].strip().lower()
+        if content_type != 'application/json':
+            self._send_json(415, {'error': 'Content-Type must be application/json'})
+            return
+
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            data = json.loads(self.rfile.read(length) or b'{}')
+            if not isinstance(data, dict):
+                raise ValidationError("Request body must be a JSON object")
+            priority = data.get('priority', 0)
+            # bool is an int subclass; floats (including Infinity/NaN) are rejected
+            if not isinstance(priority, int) or isinstance(priority, bool):
+                raise ValidationError("priority must be an integer")
+            job = self.service.submit(
+                data['input_path'],
+                output_format=data.get('output_format', 'pdf'),
+                output_path=data.get('output_path'),
+                priority=priority
+            )
+        except (ValidationError, KeyError, TypeError, ValueError, OverflowError) as e:
+            self._send_json(400, {'error': str(e)})
+            return
+
+        self._send_json(201, job.to_dict())
+
+    def do_DELETE(self):
+        if self._reject_request():
+            return
+
+        job_id = self._job_id()
+        if self.service.cancel(job_id):
+            self._send_json(200, self.service.get_job(job_id).to_dict())
+        elif self.service.get_job(job_id) is None:
+            self._send_json(404, {'error': 'Job not found'})
+        else:
+            self._send_json(409, {'error': 'Only queued jobs can be cancelled'})
+
+    def address_string(self):
+        # Unix socket peers have no address
+        return self.client_address[0] if self.client_address else 'unix'
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} - {format % args}")
+
+
+class ThreadingUnixHTTPServer(ThreadingMixIn, UnixStreamServer):
+    """HTTP server on a Unix socket, only reachable by local processes"""
+    daemon_threads = True
+
+    def server_bind(self):
+        self._remove_stale_socket()
+        # Create the socket file without group/other access from the start
+        old_umask = os.umask(0o177)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(old_umask)
+
+    def _remove_stale_socket(self):
+        """Remove a leftover socket file, refusing anything else at the path"""
+        path = self.server_address
+        try:
+            mode = os.lstat(path).st_mode
+        except FileNotFoundError:
+            return
+
+        if not stat.S_ISSOCK(mode):
+            raise OSError(errno.EEXIST, "Path exists and is not a socket", path)
+
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(path)
+        except ConnectionRefusedError:
+            os.remove(path)
+            return
+        finally:
+            probe.close()
+        raise OSError(errno.EADDRINUSE, "A translation service is already listening", path)
+
+
+def write_token(token_file=SERVICE_TOKEN_FILE):
+    """Generate a fresh access token and store it readable by the owner only"""
+    token = secrets.token_urlsafe(32)
+    os.makedirs(os.path.dirname(token_file), exist_ok=True)
+    if os.path.exists(token_file):
+        os.remove(token_file)
+    fd = os.open(token_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        f.write(token)
+    return token
+
+
+def run_service(host=SERVICE_HOST, port=SERVICE_PORT, workers=SERVICE_WORKERS, socket_path=SERVICE_SOCKET):
+    """Run the translation service until interrupted
+
+    Listens on socket_path (Unix socket) when given, otherwise on host:port.
+    """
+    # Bind before starting workers so a busy address fails fast
+    if socket_path:
+        httpd = ThreadingUnixHTTPServer(socket_path, ServiceRequestHandler)
+        address = f"unix:{socket_path}"
+    else:
+        httpd = ThreadingHTTPServer((host, port), ServiceRequestHandler)
+        address = f"http://{host}:{port}"
+
+    service = TranslationService(workers=workers)
+    service.start()
+    httpd.service = service
+    httpd.token = write_token()
+    logger.info(f"Translation service listening on {address}")
+
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Shutting down translation service")
+    finally:
+        httpd.server_close()
+        if socket_path and os.path.exists(socket_path):
+            os.remove(socket_path)
+        if os.path.exists(SERVICE_TOKEN_FILE):
+            os.remove(SERVICE_TOKEN_FILE)
+        service.stop()
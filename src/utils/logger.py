@@ -1,35 +1,100 @@
+import atexit
+import copy
+import json
 import logging
 import os
+import queue
 from datetime import datetime
-from config import LOGS_DIR
+from logging.handlers import QueueHandler, QueueListener
+from config import LOGS_DIR, LOG_FORMAT, LOG_LEVEL, LOG_PAGE_INTERVAL
+
+# Single background writer shared by every module logger
+_log_queue = queue.SimpleQueue()
+_listener = None
+
+class JsonFormatter(logging.Formatter):
+    """Format records as JSON lines"""
+
+    def format(self, record):
+        entry = {
+            'time': self.formatTime(record, self.datefmt),
+            'logger': record.name,
+            'level': record.levelname,
+            'message': record.getMessage(),
+            'thread': record.threadName,
+        }
+        if record.exc_info:
+            entry['exc_info'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+class _LocalQueueHandler(QueueHandler):
+    """Queue handler that keeps exc_info for the formatters on the listener"""
+
+    def prepare(self, record):
+        # The queue never leaves this process, so the traceback can travel as-is;
+        # only the message is merged so mutable args are captured at call time
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+def _create_formatter(log_format):
+    """Create text or JSON lines formatter"""
+    if log_format == 'json':
+        return JsonFormatter(datefmt='%Y-%m-%d %H:%M:%S')
+    return logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+
+def _start_listener():
+    """Start the background thread that owns the file and console handlers"""
+    global _listener
+
+    if _listener is not None:
+        return
 
-def setup_logger(name='pdf_translator', level=logging.INFO):
-    """Setup application logger with file and console handlers"""
-    logger = logging.getLogger(name)
-    logger.setLevel(level)
-    
-    # Avoid duplicate handlers
-    if logger.handlers:
-        return logger
-    
     # File handler
     log_file = os.path.join(LOGS_DIR, f'app_{datetime.now().strftime("%Y%m%d")}.log')
     file_handler = logging.FileHandler(log_file, encoding='utf-8')
     file_handler.setLevel(logging.DEBUG)
-    
+    file_handler.setFormatter(_create_formatter(LOG_FORMAT))
+
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
-    
-    # Formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    file_handler.setFormatter(formatter)
-    console_handler.setFormatter(formatter)
-    
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
-    
+    console_handler.setFormatter(_create_formatter('text'))
+
+    _listener = QueueListener(_log_queue, file_handler, console_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+
+def stop_logging():
+    """Flush queued records and stop the background writer"""
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+def setup_logger(name='pdf_translator', level=LOG_LEVEL):
+    """Setup application logger that hands records to a background writer.
+
+    Callers only enqueue records; file and console I/O happen on the
+    listener thread. The log file format is set by LOG_FORMAT.
+    """
+    logger = logging.getLogger(name)
+    logger.setLevel(level)
+
+    # Avoid duplicate handlers
+    if logger.handlers:
+        return logger
+
+    _start_listener()
+    logger.addHandler(_LocalQueueHandler(_log_queue))
+
     return logger
+
+def should_log_page(page_num, total_pages, interval=LOG_PAGE_INTERVAL):
+    """Rate-limit per-page progress messages to every Nth page"""
+    return page_num == 1 or page_num == total_pages or page_num % interval == 0
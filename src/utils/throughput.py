@@ -0,0 +1,62 @@
+import json
+import os
+import threading
+from config import THROUGHPUT_FILE, THROUGHPUT_HISTORY, DEFAULT_CHARS_PER_SECOND
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+_lock = threading.Lock()
+
+def _is_valid_sample(sample):
+    return (
+        isinstance(sample, dict)
+        and isinstance(sample.get('characters'), (int, float))
+        and isinstance(sample.get('seconds'), (int, float))
+        and sample['characters'] > 0
+        and sample['seconds'] > 0
+    )
+
+def _load_history():
+    """Load recent throughput samples, ignoring malformed entries"""
+    try:
+        with open(THROUGHPUT_FILE, encoding='utf-8') as f:
+            history = json.load(f)
+    except (OSError, ValueError):
+        return []
+
+    if not isinstance(history, list):
+        return []
+    return [sample for sample in history if _is_valid_sample(sample)]
+
+def record_throughput(characters, seconds):
+    """Store a measured translation throughput sample
+
+    Never raises: a finished translation must not fail because the
+    history could not be saved.
+    """
+    if characters <= 0 or seconds <= 0:
+        return
+
+    try:
+        with _lock:
+            history = _load_history()
+            history.append({'characters': characters, 'seconds': seconds})
+            history = history[-THROUGHPUT_HISTORY:]
+
+            os.makedirs(os.path.dirname(THROUGHPUT_FILE), exist_ok=True)
+            with open(THROUGHPUT_FILE, 'w', encoding='utf-8') as f:
+                json.dump(history, f)
+    except Exception as e:
+        logger.warning(f"Could not save throughput history: {str(e)}")
+
+def get_chars_per_second():
+    """Average translation throughput over recent jobs"""
+    with _lock:
+        history = _load_history()
+
+    total_chars = sum(sample['characters'] for sample in history)
+    total_seconds = sum(sample['seconds'] for sample in history)
+    if total_seconds <= 0:
+        return DEFAULT_CHARS_PER_SECOND
+    return total_chars / total_seconds